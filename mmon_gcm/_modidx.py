@@ -66,7 +66,15 @@ d = { 'settings': { 'branch': 'main',
                                                                                                            'mmon_gcm/runalternativemodes.py')},
             'mmon_gcm.runconstraintscan': {},
             'mmon_gcm.solvemodels': {},
-            'mmon_gcm.solving': { 'mmon_gcm.solving.add_pfba_Weighted': ('functions/solving.html#add_pfba_weighted', 'mmon_gcm/solving.py'),
+            'mmon_gcm.solving': { 'mmon_gcm.solving._fva_step_directed': ( 'functions/solving.html#_fva_step_directed',
+                                                                           'mmon_gcm/solving.py'),
+                                  'mmon_gcm.solving._init_lp_worker_from_file': ( 'functions/solving.html#_init_lp_worker_from_file',
+                                                                                  'mmon_gcm/solving.py'),
+                                  'mmon_gcm.solving._init_worker_from_file': ( 'functions/solving.html#_init_worker_from_file',
+                                                                               'mmon_gcm/solving.py'),
+                                  'mmon_gcm.solving._lp_fva_step': ('functions/solving.html#_lp_fva_step', 'mmon_gcm/solving.py'),
+                                  'mmon_gcm.solving._to_lp_payload': ('functions/solving.html#_to_lp_payload', 'mmon_gcm/solving.py'),
+                                  'mmon_gcm.solving.add_pfba_Weighted': ('functions/solving.html#add_pfba_weighted', 'mmon_gcm/solving.py'),
                                   'mmon_gcm.solving.check_fba_fva_run': ('functions/solving.html#check_fba_fva_run', 'mmon_gcm/solving.py'),
                                   'mmon_gcm.solving.flux_variability_analysis': ( 'functions/solving.html#flux_variability_analysis',
                                                                                   'mmon_gcm/solving.py'),
@@ -29,12 +29,15 @@ def get_real_reaction_ids(model):
     return reactions_to_weight
 
 # %% ../src/functions/alternativemodes.ipynb 4
-def solve_model_with_weightings(weightings, model, temp_results_path):
+def solve_model_with_weightings(weightings, model, temp_results_path, objective_bound=None):
     print(f"Solving solution {weightings.name}")
 
     weightings_dict = dict(weightings)
     model, solution = pfba_Weighted(
-        model, weightings=weightings_dict, objective="Phloem_tx_overall"
+        model,
+        weightings=weightings_dict,
+        objective="Phloem_tx_overall",
+        objective_bound=objective_bound,
     )
 
     if temp_results_path != None:
@@ -3,7 +3,7 @@
 # %% auto 0
 __all__ = ['results_path', 'model_path', 'weightings_csv', 'parameters_csv', 'light_colour', 'atpase_constraint',
            'starch_knockout', 'no_cores', 'model', 'parameters_df', 'arabidopsis_supermodel', 'weightings',
-           'temp_results', 'weightings_solution', 'get_file_names_as_integers']
+           'temp_results', 'objective_bound', 'weightings_solution', 'get_file_names_as_integers']
 
 # %% ../src/4.2_run_alternative_flux_modes.ipynb 5
 import os
@@ -151,11 +151,17 @@ else:
     Path(temp_results).mkdir(parents=True, exist_ok=True)
 
 # %% ../src/4.2_run_alternative_flux_modes.ipynb 24
+# the optimal phloem output doesn't depend on the weightings, so solve for it once
+with arabidopsis_supermodel.fba_model as m:
+    m.objective = "Phloem_tx_overall"
+    objective_bound = m.slim_optimize(error_value=None)
+print(f"Optimal phloem output is {objective_bound}")
+
 pandarallel.initialize(nb_workers=no_cores, progress_bar=False)
 print(f"Solving model for {len(weightings.index)} alternative weightings")
 weightings_solution = weightings.parallel_apply(
     mmon_gcm.alternativemodes.solve_model_with_weightings,
-    args=([arabidopsis_supermodel.fba_model, temp_results]),
+    args=([arabidopsis_supermodel.fba_model, temp_results, objective_bound]),
     axis=1,
 )
 
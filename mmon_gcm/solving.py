@@ -5,16 +5,21 @@ __all__ = ['pfba_Weighted', 'add_pfba_Weighted', 'get_weightings', 'flux_variabi
            'get_sum_of_fluxes', 'rev2irrev', 'check_fba_fva_run', 'get_pfba_fva_solution']
 
 # %% ../src/functions/solving.ipynb 3
-from itertools import chain
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
 
 import numpy as np
 import pandas as pd
-from cobra import flux_analysis
+from cobra import Configuration, Reaction, flux_analysis
 from cobra.core.solution import get_solution
 from cobra.util import solver as sutil
 from .buildingediting import check_number_of_models
 from optlang.symbolics import Zero
 
+from cobra.flux_analysis import variability
 from cobra.flux_analysis.variability import _init_worker, _fva_step
 
 import logging
@@ -26,9 +31,16 @@ from cobra.util import ProcessPool
 import time
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 # %% ../src/functions/solving.ipynb 5
 def pfba_Weighted(
-    model, weightings=None, fraction_of_optimum=1.0, objective=None, reactions=None
+    model,
+    weightings=None,
+    fraction_of_optimum=1.0,
+    objective=None,
+    reactions=None,
+    objective_bound=None,
 ):
     """Perform basic pFBA (parsimonious Enzyme Usage Flux Balance Analysis)
     to minimize total flux.
@@ -53,6 +65,11 @@ def pfba_Weighted(
         List of reactions or reaction identifiers. Implies `return_frame` to
         be true. Only return fluxes for the given reactions. Faster than
         fetching all fluxes if only a few are needed.
+    objective_bound : float, optional
+        Bound for the original objective, i.e. maximal_value *
+        fraction_of_optimum. If given, the initial FBA solve is skipped, which
+        saves one LP per call when the same model is solved repeatedly, e.g.
+        with different weightings.
 
     ##### Returns:
     cobra.Solution
@@ -69,17 +86,24 @@ def pfba_Weighted(
     reactions = (
         model.reactions if reactions is None else model.reactions.get_by_any(reactions)
     )
-    tempmodel = model.copy()
-    with tempmodel as m:
+    # the context reverts the pFBA objective and constraint on exit, so no copy
+    # of the model is needed
+    with model as m:
         add_pfba_Weighted(
-            m, weightings, objective=objective, fraction_of_optimum=fraction_of_optimum
+            m,
+            weightings,
+            objective=objective,
+            fraction_of_optimum=fraction_of_optimum,
+            objective_bound=objective_bound,
         )
         m.slim_optimize(error_value=None)
         solution = get_solution(m, reactions=reactions)
-    return m, solution
+    return model, solution
 
 # %% ../src/functions/solving.ipynb 7
-def add_pfba_Weighted(model, weightings=None, objective=None, fraction_of_optimum=1.0):
+def add_pfba_Weighted(
+    model, weightings=None, objective=None, fraction_of_optimum=1.0, objective_bound=None
+):
     """
     This function is a modified version of cobrapy add_pfba function
 
@@ -99,63 +123,77 @@ def add_pfba_Weighted(model, weightings=None, objective=None, fraction_of_optimu
         Fraction of optimum which must be maintained. The original objective
         reaction is constrained to be greater than maximal_value *
         fraction_of_optimum.
+    objective_bound : float, optional
+        Precomputed maximal_value * fraction_of_optimum, skips solving for it.
     """
-    if weightings == None:
+    if weightings is None:
         weightings = get_weightings(model)
+    if isinstance(weightings, pd.Series):
+        weightings = weightings.to_dict()
     if objective is not None:
         model.objective = objective
     if model.solver.objective.name == "_pfba_objective":
         raise ValueError("The model already has a pFBA objective.")
-    sutil.fix_objective_as_constraint(model, fraction=fraction_of_optimum)
-    reaction_variables = (
-        (rxn.forward_variable, rxn.reverse_variable) for rxn in model.reactions
+    sutil.fix_objective_as_constraint(
+        model, fraction=fraction_of_optimum, bound=objective_bound
     )
-    variables = chain(*reaction_variables)
     model.objective = model.problem.Objective(
         Zero, direction="min", sloppy=True, name="_pfba_objective"
     )
-    # print([v for v in variables])
+    # weightings are keyed either by reaction id or, e.g. for alternative modes,
+    # by reaction id without the phase tag
     tempDict = dict()
-    for v in variables:
-        w = str(v).split("=")[1].replace(" ", "").replace("<", "")
-        found = False
-        for rxn in weightings.keys():
-            if w.__contains__(rxn):
-                tempDict[v] = weightings[rxn]
-                found = True
-                break
-        if not found:
-            print(
-                "Weightings for reaction " + w + " not found, so assuming weighting = 1"
-            )
-            tempDict[v] = 1
+    not_found = []
+    for rxn in model.reactions:
+        if rxn.id in weightings:
+            w = weightings[rxn.id]
+        elif rxn.id[:-2] in weightings:
+            w = weightings[rxn.id[:-2]]
+        else:
+            not_found.append(rxn.id)
+            w = 1
+        tempDict[rxn.forward_variable] = w
+        tempDict[rxn.reverse_variable] = w
+    if len(not_found) > 0:
+        warn(
+            f"Weightings for {len(not_found)} reactions not found, so assuming weighting = 1: "
+            + ", ".join(not_found),
+            UserWarning,
+        )
     model.objective.set_linear_coefficients(tempDict)
 
 # %% ../src/functions/solving.ipynb 9
 def get_weightings(model):
     """
     This function is used by pfba_weighted to generate default weightings for the guard cell model
-    It takes the model as an argument and returns the weightings based on the phase lengths of the model.
+    It takes the model as an argument and returns the weightings based on the phase lengths of the model,
+    as a pandas Series indexed by reaction id.
     """
-    weightings = {}
     number_of_models = check_number_of_models(model)
+    ids = np.array([reaction.id for reaction in model.reactions], dtype=str)
+    # constraint, combined and exchange reactions are not weighted in any phase
+    zero_mask = (
+        (np.char.find(ids, "constraint") >= 0)
+        | (np.char.find(ids, "overall") >= 0)
+        | (np.char.find(ids, "sum") >= 0)
+        | np.char.startswith(ids, "EX")
+    )
+    # phase tag of the reactions that can be weighted, worked out once for all phases
+    phase_tags = np.where(
+        zero_mask, "", [reaction.id[-1:] for reaction in model.reactions]
+    )
+    values = np.full(len(ids), np.nan)
+    values[zero_mask] = 0
     for i in range(1, number_of_models + 1):
         length_of_phase = 1 / (
             -model.reactions.get_by_id(f"SUCROSE_v_gc_Linker_{i}").get_coefficient(
                 f"SUCROSE_v_gc_{i}"
             )
         )
-        for reaction in model.reactions:
-            if (
-                "constraint" in reaction.id
-                or "overall" in reaction.id
-                or "sum" in reaction.id
-                or reaction.id[:2] == "EX"
-            ):
-                weightings[reaction.id] = 0
-            elif reaction.id[-1] == str(i):
-                weightings[reaction.id] = length_of_phase
-    return weightings
+        values[phase_tags == str(i)] = length_of_phase
+    # reactions without a phase tag don't get a weighting
+    weighted = ~np.isnan(values)
+    return pd.Series(values[weighted], index=ids[weighted], dtype=np.float64)
 
 # %% ../src/functions/solving.ipynb 11
 def flux_variability_analysis(
@@ -239,10 +277,9 @@ def flux_variability_analysis(
         reaction_ids = [r.id for r in model.reactions.get_by_any(reaction_list)]
 
     if processes is None:
-        processes = configuration.processes
+        processes = Configuration().processes
 
     num_reactions = len(reaction_ids)
-    processes = min(processes, num_reactions)
 
     fva_result = pd.DataFrame(
         {
@@ -251,6 +288,24 @@ def flux_variability_analysis(
         },
         index=reaction_ids,
     )
+
+    # Reactions with equal bounds can only carry that flux, so no LPs are
+    # needed for them.
+    fixed_bounds = pd.Series(
+        {
+            rxn.id: rxn.lower_bound
+            for rxn in model.reactions.get_by_any(reaction_ids)
+            if rxn.lower_bound == rxn.upper_bound
+        },
+        dtype=float,
+    )
+    fva_result.loc[fixed_bounds.index, "minimum"] = fixed_bounds
+    fva_result.loc[fixed_bounds.index, "maximum"] = fixed_bounds
+    reaction_ids = [
+        rxn_id for rxn_id in reaction_ids if rxn_id not in fixed_bounds.index
+    ]
+
+    processes = min(processes, len(reaction_ids))
     prob = model.problem
     with model:
         # Safety check before setting up FVA.
@@ -258,6 +313,21 @@ def flux_variability_analysis(
             error_value=None,
             message="There is no optimal solution for the chosen objective!",
         )
+        # The optimal solution is feasible for every FVA problem, so a reaction
+        # already at one of its bounds has that bound as its minimum/maximum and
+        # the LP can be skipped. This does not hold for loopless solutions or
+        # once the flux sum is constrained by pfba_factor.
+        solved = set()
+        if not loopless and pfba_factor is None:
+            primals = model.solver.primal_values
+            for rxn in model.reactions.get_by_any(reaction_ids):
+                flux = primals[rxn.id] - primals[rxn.reverse_id]
+                if flux == rxn.lower_bound:
+                    fva_result.at[rxn.id, "minimum"] = flux
+                    solved.add(("minimum", rxn.id))
+                if flux == rxn.upper_bound:
+                    fva_result.at[rxn.id, "maximum"] = flux
+                    solved.add(("maximum", rxn.id))
         # Add the previous objective as a variable to the model then set it to
         # zero. This also uses the fraction to create the lower/upper bound for
         # the old objective.
@@ -299,30 +369,141 @@ def flux_variability_analysis(
             model.add_cons_vars([flux_sum, flux_sum_constraint])
 
         model.objective = Zero  # This will trigger the reset as well
-        for what in ("minimum", "maximum"):
-            if processes > 1:
-                # We create and destroy a new pool here in order to set the
-                # objective direction for all reactions. This creates a
-                # slight overhead but seems the most clean.
-                chunk_size = len(reaction_ids) // processes
+        # Solve all minimisations before all maximisations, with reactions in
+        # model order, so consecutive LPs stay close and can reuse the basis.
+        reaction_ids = sorted(reaction_ids, key=model.reactions.index)
+        tasks = [
+            (what, rxn_id)
+            for what in ("minimum", "maximum")
+            for rxn_id in reaction_ids
+            if (what, rxn_id) not in solved
+        ]
+        if processes > 1:
+            # A single pool serves both directions, the direction is switched
+            # per task by the step function.
+            # Around four chunks per worker keeps the load balanced while
+            # cutting the number of IPC round trips for small LPs.
+            chunk_size = max(1, len(tasks) // (processes * 4))
+            # Forked workers inherit the model for free and on Windows cobra's
+            # ProcessPool already passes the initargs through a tempfile, so
+            # only pickle the worker data to disk ourselves on spawn.
+            spawned = (
+                sys.platform != "win32"
+                and multiprocessing.get_start_method() != "fork"
+            )
+            if spawned and not loopless:
+                # the LP alone is enough, which is much smaller to pickle than
+                # the model with its metabolites, genes and notes
+                init_data = _to_lp_payload(model, reaction_ids)
+                initializer, step = _init_lp_worker_from_file, _lp_fva_step
+            elif spawned:
+                # loopless FVA needs the full cobra model in the workers
+                init_data = (model, loopless, "min")
+                initializer, step = _init_worker_from_file, _fva_step_directed
+            else:
+                init_data = None
+                initializer, step = _init_worker, _fva_step_directed
+                initargs = (model, loopless, "min")
+            tmp_path = None
+            try:
+                if init_data is not None:
+                    # Pickle the worker data once to disk so that workers load
+                    # it from there instead of it being pickled for each worker.
+                    with tempfile.NamedTemporaryFile(
+                        suffix=".pkl", delete=False
+                    ) as tmp:
+                        tmp_path = tmp.name
+                        pickle.dump(init_data, tmp)
+                    initargs = (tmp_path,)
                 with ProcessPool(
                     processes,
-                    initializer=_init_worker,
-                    initargs=(model, loopless, what[:3]),
+                    initializer=initializer,
+                    initargs=initargs,
                 ) as pool:
-                    for rxn_id, value in pool.imap_unordered(
-                        _fva_step, reaction_ids, chunksize=chunk_size
+                    for what, rxn_id, value in pool.imap_unordered(
+                        step, tasks, chunksize=chunk_size
                     ):
-                        print(rxn_id)
                         fva_result.at[rxn_id, what] = value
-            else:
-                _init_worker(model, loopless, what[:3])
-                for rxn_id, value in map(_fva_step, reaction_ids):
-                    fva_result.at[rxn_id, what] = value
+            finally:
+                if tmp_path is not None:
+                    os.remove(tmp_path)
+        else:
+            _init_worker(model, loopless, "min")
+            for what, rxn_id, value in map(_fva_step_directed, tasks):
+                fva_result.at[rxn_id, what] = value
 
     return fva_result[["minimum", "maximum"]]
 
 # %% ../src/functions/solving.ipynb 12
+def _init_worker_from_file(path):
+    """
+    Initialise an FVA worker from the (model, loopless, sense) tuple pickled to path.
+    """
+    with open(path, "rb") as f:
+        model, loopless, sense = pickle.load(f)
+    _init_worker(model, loopless, sense)
+
+
+def _fva_step_directed(task):
+    """
+    Run a single FVA step for a (direction, reaction id) task on the worker model,
+    switching the objective direction only when it differs from the previous task.
+    """
+    what, reaction_id = task
+    if variability._model.solver.objective.direction != what[:3]:
+        variability._model.solver.objective.direction = what[:3]
+    rxn_id, value = _fva_step(reaction_id)
+    return what, rxn_id, value
+
+
+def _to_lp_payload(model, reaction_ids):
+    """
+    Get the data an FVA worker needs without loopless: the optlang problem, which holds
+    the stoichiometry, bounds and any extra constraints, and the names of the forward
+    and reverse variables of each reaction.
+    """
+    variables = {}
+    for rxn in model.reactions.get_by_any(reaction_ids):
+        variables[rxn.id] = (rxn.forward_variable.name, rxn.reverse_variable.name)
+    return {"problem": model.solver, "variables": variables}
+
+
+def _init_lp_worker_from_file(path):
+    """
+    Initialise an FVA worker from the LP payload pickled to path.
+    """
+    global _lp_problem, _lp_variables
+    with open(path, "rb") as f:
+        payload = pickle.load(f)
+    _lp_problem = payload["problem"]
+    _lp_variables = {
+        rxn_id: (_lp_problem.variables[forward], _lp_problem.variables[reverse])
+        for rxn_id, (forward, reverse) in payload["variables"].items()
+    }
+
+
+def _lp_fva_step(task):
+    """
+    Run a single FVA step for a (direction, reaction id) task on the worker LP.
+    """
+    what, reaction_id = task
+    forward, reverse = _lp_variables[reaction_id]
+    if _lp_problem.objective.direction != what[:3]:
+        _lp_problem.objective.direction = what[:3]
+    _lp_problem.objective.set_linear_coefficients({forward: 1, reverse: -1})
+    _lp_problem.optimize()
+    sutil.check_solver_status(_lp_problem.status)
+    value = _lp_problem.objective.value
+    if value is None:
+        value = float("nan")
+        logger.warning(
+            f"Could not get flux for reaction {reaction_id}, setting it to NaN. "
+            "This is usually due to numerical instability."
+        )
+    _lp_problem.objective.set_linear_coefficients({forward: 0, reverse: 0})
+    return what, reaction_id, value
+
+# %% ../src/functions/solving.ipynb 13
 def pFBA_FVA_run(cobra_model, obj, rxnlist=[], processes=3, fix_sof_for_fva=False):
 
     print("Running pFBA")
@@ -332,42 +513,47 @@ def pFBA_FVA_run(cobra_model, obj, rxnlist=[], processes=3, fix_sof_for_fva=Fals
 
     if fix_sof_for_fva == True:
 
-        sum_of_fluxes = get_sum_of_fluxes(cobra_model)
-
         # get the weightings for SOF and generate a copy of the model that, where weightings are not zero and the reaction is reversible,
         # splits the reaction into a forwards and reverse reaction and makes them both irreversible
         weightings = get_weightings(cobra_model)
-        cobra_model2 = cobra_model.copy()
-        irr_model = rev2irrev(cobra_model2)
+        sum_of_fluxes = get_sum_of_fluxes(cobra_model, weightings=weightings)
+
+        irr_model = rev2irrev(cobra_model)
         print("Setting SOF model")
 
         # set the weightings for the reverse reactions to be the same as the forward reactions
-        for reaction in irr_model.reactions:
-            if reaction.id.__contains__("_reverse"):
-                id = reaction.id
-                originalreaction = id.replace("_reverse", "")
-                weightings[reaction.id] = weightings[originalreaction]
+        reverse_ids = pd.Index(
+            [
+                reaction.id
+                for reaction in irr_model.reactions
+                if reaction.id.endswith("_reverse")
+            ]
+        )
+        reverse_weightings = pd.Series(
+            weightings.loc[reverse_ids.str.replace("_reverse$", "", regex=True)].values,
+            index=reverse_ids,
+        )
+        weightings = pd.concat(
+            [weightings.drop(reverse_ids, errors="ignore"), reverse_weightings]
+        )
 
         # weight the forward and reverse reactions of the reactions, whether they are forward or reverse, equally for SOF.
         # Add a constraint to the model that the sum of these reactions with their coefficients cannot be different to the sum_of_fluxes from pFBA
         coefficients = {}
-        for reaction in irr_model.reactions:
-            coefficients[reaction.forward_variable] = weightings[reaction.id]
-            coefficients[reaction.reverse_variable] = weightings[reaction.id]
+        reaction_weightings = weightings.loc[
+            [reaction.id for reaction in irr_model.reactions]
+        ]
+        for reaction, weighting in zip(irr_model.reactions, reaction_weightings):
+            coefficients[reaction.forward_variable] = weighting
+            coefficients[reaction.reverse_variable] = weighting
         sofconstraint = irr_model.problem.Constraint(
             0, lb=sum_of_fluxes, ub=sum_of_fluxes, name="sofconstraint"
         )
-        irr_model.add_cons_vars(sofconstraint)
-        irr_model.solver.update()
-        sofconstraint.set_linear_coefficients(coefficients=coefficients)
 
         new_coefficients = coefficients.copy()
-        sum_of_fluxes = irr_model.problem.Variable("sum_of_fluxes")
-        new_coefficients[sum_of_fluxes] = -1
+        sum_of_fluxes_var = irr_model.problem.Variable("sum_of_fluxes")
+        new_coefficients[sum_of_fluxes_var] = -1
         sofvariableconstraint = irr_model.problem.Constraint(0, lb=0, ub=0)
-        irr_model.add_cons_vars([sum_of_fluxes, sofvariableconstraint])
-        irr_model.solver.update()
-        sofvariableconstraint.set_linear_coefficients(coefficients=new_coefficients)
 
         # fix objective to be equal to pFBA
         phloemconstraint = irr_model.problem.Constraint(
@@ -376,57 +562,36 @@ def pFBA_FVA_run(cobra_model, obj, rxnlist=[], processes=3, fix_sof_for_fva=Fals
             ub=objvalue,
             name="phloem_output",
         )
-        irr_model.add_cons_vars(phloemconstraint)
 
-        irr_model.optimize()
+        # add everything in one go so the solver is only updated once
+        irr_model.add_cons_vars(
+            [sofconstraint, sum_of_fluxes_var, sofvariableconstraint, phloemconstraint]
+        )
+        irr_model.solver.update()
+        sofconstraint.set_linear_coefficients(coefficients=coefficients)
+        sofvariableconstraint.set_linear_coefficients(coefficients=new_coefficients)
 
-        sfmodel = irr_model.copy()
+        irr_model.optimize()
 
         rxnlist2 = []
 
         # if rxnlist is not empty, add just the forward reaction if it isn't reversible or add both forward and reverse if it is
         for rxn in rxnlist:
-            rxn = sfmodel.reactions.get_by_id(rxn.id)
+            rxn = irr_model.reactions.get_by_id(rxn.id)
             if rxn.lower_bound < 0 and rxn.upper_bound > 0 and weightings[rxn.id] != 0:
-                rxnlist2.append(sfmodel.reactions.get_by_id(rxn.id + "_reverse"))
-            rxnlist2.append(sfmodel.reactions.get_by_id(rxn.id))
+                rxnlist2.append(irr_model.reactions.get_by_id(rxn.id + "_reverse"))
+            rxnlist2.append(irr_model.reactions.get_by_id(rxn.id))
 
         print("Running FVA")
 
-        fva = flux_analysis.flux_variability_analysis(sfmodel, reaction_list=rxnlist2, processes=processes)
+        fva = flux_analysis.flux_variability_analysis(irr_model, reaction_list=rxnlist2, processes=processes)
         print("Processing results")
 
-        fva2 = dict()
-        for mode in fva.keys():
-            if mode == "maximum":
-                tempdict = dict()
-                FVArxnSet = set()
-                for rxn in fva[mode].keys():
-                    if rxn.__contains__("_reverse"):
-                        rxn = rxn.replace("_reverse", "")
-                    if FVArxnSet.__contains__(rxn):
-                        continue
-                    FVArxnSet.add(rxn)
-                    if not fva[mode].keys().__contains__(rxn + "_reverse"):
-                        maxi = fva[mode][rxn]
-                    else:
-                        maxi = fva[mode][rxn] + fva[mode][rxn + "_reverse"]
-                    tempdict[rxn] = maxi
-            else:
-                tempdict = dict()
-                FVArxnSet = set()
-                for rxn in fva[mode].keys():
-                    if rxn.__contains__("_reverse"):
-                        rxn = rxn.replace("_reverse", "")
-                    if FVArxnSet.__contains__(rxn):
-                        continue
-                    FVArxnSet.add(rxn)
-                    if not fva[mode].keys().__contains__(rxn + "_reverse"):
-                        mini = fva[mode][rxn]
-                    else:
-                        mini = fva[mode][rxn] + fva[mode][rxn + "_reverse"]
-                    tempdict[rxn] = mini
-            fva2[mode] = tempdict
+        # add the fluxes of the reverse reactions to those of their forward reactions
+        base_ids = fva.index.str.replace("_reverse$", "", regex=True)
+        fva2 = fva.groupby(base_ids, sort=False).sum()
+        # a failed FVA solve is NaN and must stay NaN rather than be summed as 0
+        fva2 = fva2.mask(fva.isna().groupby(base_ids, sort=False).any()).to_dict()
 
         cobra_model.fva = fva2
 
@@ -443,14 +608,17 @@ def pFBA_FVA_run(cobra_model, obj, rxnlist=[], processes=3, fix_sof_for_fva=Fals
     return cobra_model, solution
 
 # %% ../src/functions/solving.ipynb 14
-def get_sum_of_fluxes(model):
-    weightings = get_weightings(model)
-    sum_of_fluxes = 0
-    for reaction_id in weightings.keys():
-        sum_of_fluxes = sum_of_fluxes + (
-            abs(model.reactions.get_by_id(reaction_id).flux) * weightings[reaction_id]
-        )
-    return sum_of_fluxes
+def get_sum_of_fluxes(model, weightings=None):
+    if weightings is None:
+        weightings = get_weightings(model)
+    weightings = pd.Series(weightings, dtype=float)
+    # zero weighted reactions don't contribute, so only fetch the others
+    weightings = weightings[weightings != 0]
+    # fetch all primals in one go rather than reaction by reaction; reverse
+    # variables are taken into account so fluxes are net fluxes
+    reactions = model.reactions.get_by_any(weightings.index.tolist())
+    fluxes = get_solution(model, reactions=reactions, raise_error=True).fluxes
+    return float(np.abs(fluxes.to_numpy()) @ weightings.to_numpy())
 
 # %% ../src/functions/solving.ipynb 16
 def rev2irrev(cobra_model):
@@ -462,14 +630,22 @@ def rev2irrev(cobra_model):
     output: a cobra model with only irreversible reactions
     """
     exp_model = cobra_model.copy()
-    for RXN in cobra_model.reactions:
-        rxn = exp_model.reactions.get_by_id(RXN.id)
+    reverse_reactions = []
+    for rxn in exp_model.reactions:
         if rxn.lower_bound < 0:
-            rxn_reverse = rxn.copy()
-            rxn_reverse.id = "%s_reverse" % (rxn.id)
+            rxn_reverse = Reaction(
+                "%s_reverse" % (rxn.id),
+                name=rxn.name,
+                subsystem=rxn.subsystem,
+                lower_bound=rxn.lower_bound,
+                upper_bound=0,
+            )
+            rxn_reverse.add_metabolites(rxn.metabolites)
+            rxn_reverse.gene_reaction_rule = rxn.gene_reaction_rule
+            reverse_reactions.append(rxn_reverse)
             rxn.lower_bound = 0
-            rxn_reverse.upper_bound = 0
-            exp_model.add_reaction(rxn_reverse)
+    # add all reverse reactions at once so the solver is only updated once
+    exp_model.add_reactions(reverse_reactions)
 
     return exp_model
 
@@ -479,10 +655,8 @@ def check_fba_fva_run(fba_model, pfba_solution):
     This is a test that checks if the fluxes that are returned 
     by the fba model are different to those by the pFBA
     '''
-    fva_fluxes = np.array(
-        [reaction.flux for reaction in fba_model.reactions]
-    )
-    if len(pfba_solution[pfba_solution.fluxes - fva_fluxes != 0]) > 0:
+    fva_fluxes = get_solution(fba_model, raise_error=True).fluxes
+    if pfba_solution.fluxes.ne(fva_fluxes.reindex(pfba_solution.fluxes.index)).any():
         return False
     else:
         return True